@@ -0,0 +1,65 @@
+from asyncio import run
+
+from twitchbot import Mod, Event, register_mod, unregister_mod, trigger_mod_event
+from twitchbot.modloader import _event_handlers
+
+
+class _ConnectedMod(Mod):
+    name = 'test_connected_mod'
+
+    def __init__(self):
+        self.calls = []
+
+    async def on_connected(self):
+        self.calls.append(Event.on_connected)
+        return self.name
+
+
+def _handler_count(mod: Mod) -> int:
+    return sum(1 for handlers in _event_handlers.values() for registered, _ in handlers if registered is mod)
+
+
+def _run_with_registered_mod(test):
+    async def _run():
+        mod = _ConnectedMod()
+        assert register_mod(mod)
+        try:
+            await test(mod)
+        finally:
+            unregister_mod(mod)
+
+    run(_run())
+
+
+def test_mod_only_receives_overridden_events():
+    async def test(mod):
+        assert mod.name in await trigger_mod_event(Event.on_connected)
+        assert mod.name in await trigger_mod_event('on_connected')
+        assert mod.name not in await trigger_mod_event(Event.on_user_join, 'user', None)
+        assert mod.calls == [Event.on_connected, Event.on_connected]
+        assert not any(registered is mod for registered, _ in _event_handlers[Event.on_user_join.value])
+
+    _run_with_registered_mod(test)
+
+
+def test_duplicate_registration_does_not_double_handlers():
+    async def test(mod):
+        assert not register_mod(mod)
+        assert not register_mod(_ConnectedMod())
+        assert _handler_count(mod) == 1
+
+        await trigger_mod_event(Event.on_connected)
+        assert mod.calls == [Event.on_connected]
+
+    _run_with_registered_mod(test)
+
+
+def test_unregister_removes_handlers():
+    async def test(mod):
+        assert _handler_count(mod) == 1
+        assert unregister_mod(mod)
+        assert _handler_count(mod) == 0
+        assert mod.name not in await trigger_mod_event(Event.on_connected)
+        assert not unregister_mod(mod)
+
+    _run_with_registered_mod(test)
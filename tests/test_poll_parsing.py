@@ -0,0 +1,86 @@
+from asyncio import run
+
+from pytest import raises
+
+from twitchbot import Message, Channel, InvalidArgumentsError
+from twitchbot.builtin_commands.poll_commands import (
+    _parse_poll_data, cmd_start_poll, DEFAULT_POLL_DURATION, MAX_POLL_CHOICES
+)
+
+from .mock_irc import MockIrc
+
+CHANNEL = 'testchannel'
+Channel(CHANNEL, MockIrc())
+
+
+def _message(args: str) -> Message:
+    return Message(f':user!user@user.tmi.twitch.tv PRIVMSG #{CHANNEL} :!startpoll {args}')
+
+
+def _parse(args: str):
+    return _parse_poll_data(_message(args))
+
+
+def _start_poll_error(args: str) -> str:
+    with raises(InvalidArgumentsError) as e:
+        run(cmd_start_poll.execute(_message(args)))
+    return e.value.reason
+
+
+def test_parse_poll():
+    poll = _parse('what should i eat? [apples, oranges, potatos] 30')
+    assert poll.title == 'what should i eat?'
+    assert poll.choices == ['apples', 'oranges', 'potatos']
+    assert poll.duration_seconds == 30
+
+
+def test_parse_poll_title_with_brackets():
+    poll = _parse('what [really]? [a, b] 30')
+    assert poll.title == 'what [really]?'
+    assert poll.choices == ['a', 'b']
+    assert poll.duration_seconds == 30
+
+    poll = _parse('[tag] lunch? [a, b]')
+    assert poll.title == '[tag] lunch?'
+    assert poll.choices == ['a', 'b']
+
+
+def test_parse_poll_non_ascii():
+    poll = _parse('café? [oui, não, да, 是]')
+    assert poll.title == 'café?'
+    assert poll.choices == ['oui', 'não', 'да', '是']
+
+
+def test_parse_poll_missing_closing_bracket():
+    assert _parse('what should i eat? [apples, oranges') is None
+
+
+def test_parse_poll_empty_title_or_options():
+    assert _parse('[apples, oranges]') is None
+    assert _parse('what should i eat? []') is None
+    assert _parse('what should i eat? [ , ]') is None
+
+
+def test_parse_poll_max_choices():
+    choices = [str(i) for i in range(MAX_POLL_CHOICES)]
+    assert _parse(f'pick one [{", ".join(choices)}]').choices == choices
+
+    too_many = ', '.join(choices + [str(MAX_POLL_CHOICES)])
+    assert 'at most' in _start_poll_error(f'pick one [{too_many}]')
+    # a badly formatted poll reports the format error, not the choice count
+    assert 'improperly formatted' in _start_poll_error(f'[{too_many}] 30')
+
+
+def test_parse_poll_default_duration():
+    assert _parse('what should i eat? [apples, oranges]').duration_seconds == DEFAULT_POLL_DURATION
+
+
+def test_parse_poll_duration_uses_leading_number():
+    assert _parse('what should i eat? [apples, oranges] 30 seconds').duration_seconds == 30
+    assert _parse('what should i eat? [apples, oranges] 1.5').duration_seconds == 1.5
+
+
+def test_parse_poll_rejects_invalid_durations():
+    for duration in ('inf', 'nan', '-5', '0', 'abc', '9' * 400):
+        poll = _parse(f'what should i eat? [apples, oranges] {duration}')
+        assert poll.duration_seconds == DEFAULT_POLL_DURATION, duration
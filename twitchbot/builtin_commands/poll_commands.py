@@ -1,12 +1,15 @@
-from twitchbot import *
+from math import isfinite
 
-RE_POLL_INFO = re.compile(r'(?P<title>.+)\[(?P<options>[\w\d\s,]+)]\s*(?P<time>[0-9.]*)')
+from twitchbot import *
 
 VOTE_PERMISSION = 'vote'
 START_POLL_PERMISSION = 'startpoll'
 LIST_POLLS_PERMISSION = 'listpolls'
 POLL_INFO_PERMISSION = 'pollinfo'
 DEFAULT_POLL_DURATION = 60
+MAX_POLL_TITLE_LENGTH = 200
+MAX_POLL_OPTIONS_LENGTH = 500
+MAX_POLL_CHOICES = 16
 
 
 @Command('startpoll',
@@ -24,6 +27,9 @@ async def cmd_start_poll(msg: Message, *args):
             cmd=cmd_start_poll
         )
 
+    if len(poll.choices) > MAX_POLL_CHOICES:
+        raise InvalidArgumentsError(reason=f'polls can have at most {MAX_POLL_CHOICES} choices', cmd=cmd_start_poll)
+
     await poll.start()
 
 
@@ -36,14 +42,16 @@ async def cmd_vote(msg: Message, *args):
         raise InvalidArgumentsError(reason='missing required vote arguments, must provide the id of the choice you want to vote for', cmd=cmd_vote)
 
     choice = args[0]
-    count = get_active_channel_poll_count(msg.channel_name)
+    channel = msg.channel_name
+    polls = get_active_channel_polls(channel)
+    count = len(polls)
 
     if not count:
         await msg.reply('there are NOT any active polls running right now to vote for')
         return
 
     if count == 1:
-        poll = get_active_channel_polls(msg.channel_name)[0]
+        poll = polls[0]
     else:
         if len(args) != 2:
             await msg.reply(
@@ -51,7 +59,7 @@ async def cmd_vote(msg: Message, *args):
             return
 
         passed_poll_id = _cast_to_int_or_error(args[1], cmd_vote)
-        poll = get_channel_poll_by_id(msg.channel_name, passed_poll_id)
+        poll = get_channel_poll_by_id(channel, passed_poll_id)
 
         if poll is None:
             raise InvalidArgumentsError(reason=f'Could not find poll by ID {passed_poll_id}', cmd=cmd_vote)
@@ -61,10 +69,11 @@ async def cmd_vote(msg: Message, *args):
         await msg.reply(f'{choice} is not a valid choice id for poll#{poll.id}, choices are: {poll.formatted_choices()}')
         return
 
-    if poll.has_already_voted(msg.author):
+    author = msg.author
+    if poll.has_already_voted(author):
         return
 
-    poll.add_vote(msg.author, choice)
+    poll.add_vote(author, choice)
 
 
 @Command('listpolls', help='list all active polls', permission=LIST_POLLS_PERMISSION)
@@ -74,7 +83,9 @@ async def cmd_list_polls(msg: Message, *args):
 
 @Command('pollinfo', syntax='(POLL_ID)', help='views info about the poll using the passed poll id', permission=POLL_INFO_PERMISSION)
 async def cmd_poll_info(msg: Message, *args):
-    count = get_active_channel_poll_count(msg.channel_name)
+    channel = msg.channel_name
+    polls = get_active_channel_polls(channel)
+    count = len(polls)
 
     if not count:
         await msg.reply('there are not any polls active right now')
@@ -87,10 +98,10 @@ async def cmd_poll_info(msg: Message, *args):
         )
 
     if count == 1:
-        poll = get_active_channel_polls(msg.channel_name)[0]
+        poll = polls[0]
     else:
         poll_id = _cast_to_int_or_error(args[0], cmd_poll_info)
-        poll = get_channel_poll_by_id(msg.channel_name, poll_id)
+        poll = get_channel_poll_by_id(channel, poll_id)
 
         if poll is None:
             raise InvalidArgumentsError(reason=f'could not find any poll by ID {poll_id}', cmd=cmd_poll_info)
@@ -99,24 +110,49 @@ async def cmd_poll_info(msg: Message, *args):
 
 
 def _cast_to_int_or_error(value: str, src_cmd) -> int:
-    if not value.isdigit():
+    try:
+        return int(value)
+    except ValueError:
         raise InvalidArgumentsError(reason=f'{value} is not a valid number', cmd=src_cmd)
-    return int(value)
 
 
 def _parse_poll_data(msg: Message) -> Optional[PollData]:
-    match = RE_POLL_INFO.search(msg[1:])
-
-    if not match:
+    # format: <title> [option1, option2, ...] (seconds)
+    body = msg[1:]
+    # the options are the last [...] group without brackets inside it, so titles can contain brackets,
+    # search back from the last ']' for its '[', bounded by the max options length
+    last_end = body.rfind(']')
+    options_start = body.rfind('[', max(0, last_end - MAX_POLL_OPTIONS_LENGTH - 1), last_end)
+
+    if last_end == -1 or options_start == -1 or options_start > MAX_POLL_TITLE_LENGTH:
         return None
 
-    title = match[1].strip()
-    choices = [s.strip() for s in match[2].split(',')]
-    seconds = _try_parse_float(match[3], DEFAULT_POLL_DURATION) if len(match.groups()) == 3 else 30
+    # a ']' after the options (ex: in the duration) must not end up in them
+    options_end = body.find(']', options_start + 1, last_end + 1)
+
+    title = body[:options_start].strip()
+    options = body[options_start + 1:options_end].split(',')
+    choices = [s for s in (option.strip() for option in options) if s]
+    seconds = _parse_poll_duration(body[options_end + 1:])
+
+    if not title or not choices:
+        return None
 
     return PollData(msg.channel, msg.author, title, seconds, *choices)
 
 
+def _parse_poll_duration(value: str) -> float:
+    # only the leading number is used, so "30 seconds" is still 30
+    value = value.lstrip()
+    number_length = len(value) - len(value.lstrip('0123456789.'))
+
+    seconds = _try_parse_float(value[:number_length], DEFAULT_POLL_DURATION)
+    # a non-finite duration would never end, and a non-positive one would end instantly
+    if not isfinite(seconds) or seconds <= 0:
+        return DEFAULT_POLL_DURATION
+    return seconds
+
+
 def _try_parse_float(value: str, default: float) -> float:
     try:
         return float(value)
@@ -1,14 +1,14 @@
+import logging
 import os
 import sys
-import traceback
 import typing
 
 from asyncio import get_event_loop
-from importlib import import_module
-from inspect import isclass, getfile, getmodulename
+from collections import defaultdict
+from importlib.util import spec_from_file_location, module_from_spec
+from inspect import getfile, getmodulename
 from pathlib import Path
-from traceback import print_exc
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, List, Tuple, DefaultDict, Union
 
 if typing.TYPE_CHECKING:
     from .poll import PollData
@@ -27,6 +27,8 @@ __all__ = ('ensure_mods_folder_exists', 'Mod', 'register_mod', 'trigger_mod_even
            'load_mods_from_directory', 'mod_exists', 'reload_mod', 'is_mod', 'unregister_mod',
            'ensure_commands_folder_exists')
 
+logger = logging.getLogger(__name__)
+
 
 # noinspection PyMethodMayBeStatic
 class Mod:
@@ -189,6 +191,8 @@ class Mod:
 
 
 mods: Dict[str, Mod] = {}
+# event name => (mod, bound event handler) for every registered mod, in registration order
+_event_handlers: DefaultDict[str, List[Tuple[Mod, Callable]]] = defaultdict(list)
 
 
 def register_mod(mod: Mod) -> bool:
@@ -197,10 +201,20 @@ def register_mod(mod: Mod) -> bool:
     :param mod: the mod to register
     :return: if registration was successful
     """
-    if mod.name in mods:
+    # setdefault only stores the mod if the name is free, if the size didn't change the name was already taken
+    # (comparing the returned value isn't enough, the same mod instance could be registered twice)
+    registered_count = len(mods)
+    mods.setdefault(mod.name, mod)
+    if len(mods) == registered_count:
         return False
 
-    mods[mod.name] = mod
+    for event in Event:
+        handler = getattr(mod, event.value, None)
+        # skip events the mod doesn't override, the base Mod implementations are no-ops
+        if handler is None or getattr(handler, '__func__', None) is getattr(Mod, event.value):
+            continue
+        _event_handlers[event.value].append((mod, handler))
+
     get_event_loop().create_task(mod.loaded())
     return True
 
@@ -211,43 +225,38 @@ def unregister_mod(mod: Mod) -> bool:
     :param mod: mod to unregister
     :return: if it successfully unregistered it
     """
-    if mod.name not in mods:
+    registered = mods.pop(mod.name, None)
+    if registered is None:
         return False
 
     get_event_loop().create_task(mod.unloaded())
-    del mods[mod.name]
+    for handlers in _event_handlers.values():
+        handlers[:] = [entry for entry in handlers if entry[0] is not registered]
     return True
 
 
-async def trigger_mod_event(event: Event, *args, channel: str = None) -> list:
+async def trigger_mod_event(event: Union[Event, str], *args, channel: str = None) -> list:
     """
     triggers a event on all mods
     if the channel is passed, the it is checked if the mod is enabled for that channel,
     if not, the event for that mod is skipped
-    :param event: the event to raise on all the mods
+    :param event: the event to raise on all the mods, can also be the event's name (ex: 'on_connected')
     :param args: the args to pass to the event
     :param channel: the channel the event is being raised from
-    :return: the result of all the mod event calls in a list
+    :return: the result of all the mod event calls in a list, mods that do not override the event are skipped
     """
-
-    async def _missing_function(*ignored):
-        pass
-
+    name = event if isinstance(event, str) else event.value
+    # snapshot the handlers, a mod can (un)register mods while handling the event
+    handlers = tuple(_event_handlers.get(name, ()))
     output = []
-    for mod in mods.values():
+    for mod, handler in handlers:
         if channel is not None and is_mod_disabled(channel, mod.name):
             continue
 
         try:
-            output.append(await getattr(mod, event.value, _missing_function)(*args))
-        except Exception as e:
-            print(f'\nerror has occurred while triggering a event on a mod, details:\n'
-                  f'mod: {mod.name}\n'
-                  f'event: {event}\n'
-                  f'error: {type(e)}\n'
-                  f'reason: {e}\n'
-                  f'stack trace:')
-            traceback.print_exc()
+            output.append(await handler(*args))
+        except Exception:
+            logger.exception('error has occurred while triggering event %s on mod %s', name, mod.name)
     return output
 
 
@@ -278,16 +287,34 @@ def load_mods_from_directory(fullpath, predicate: Callable[[str, Any], bool] = N
     with temp_syspath(fullpath):
         for file in get_py_files(fullpath):
             # we need to import the module to get its attributes
-            module = import_module(get_file_name(file))
-            for obj in module.__dict__.values():
-                # verify the obj is a class, is a subclass of Mod, and is not Mod class itself
-                if not is_mod(obj):
-                    continue
+            module = _import_module_from_file(file)
+            # verify the obj is a class, is a subclass of Mod, and is not Mod class itself
+            for obj in filter(is_mod, module.__dict__.values()):
                 # create a instance of the mod subclass, then register it
-                if predicate is None or (predicate is not None and predicate(obj.name, obj)):
+                if predicate is None or predicate(obj.name, obj):
                     register_mod(obj())
 
 
+def _import_module_from_file(file: str):
+    """
+    imports a .py file directly from its path instead of searching sys.path for it,
+    the module is still added to sys.modules so reload_mod() can find it later
+    """
+    name = get_file_name(file)
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = spec_from_file_location(name, file)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
 def reload_mod(mod_name: str):
     mod = mods.get(mod_name)
     if mod is None:
@@ -323,14 +350,13 @@ def reload_mod(mod_name: str):
                     get_event_loop().create_task(trigger_event(Event.on_mod_reloaded, reloaded_mod))
                     return True
 
-    except Exception as e:
-        print(f'error trying to reload Mod "{mod.name}", error type: {type(e)}, error: {e}')
-        print_exc()
+    except Exception:
+        logger.exception('error trying to reload Mod "%s"', mod.name)
     return False
 
 
 def is_mod(obj):
-    return isclass(obj) and issubclass(obj, Mod) and obj is not Mod
+    return isinstance(obj, type) and obj is not Mod and issubclass(obj, Mod)
 
 
 def mod_exists(mod: str) -> bool: